@@ -4,6 +4,8 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 
+from .constants import VALID_IARU_REGIONS
+
 
 @dataclass
 class DXClusterConfig:
@@ -49,7 +51,7 @@ class DXClusterConfig:
         if not self.callsign:
             raise ValueError("DX_CLUSTER_CALLSIGN cannot be empty")
 
-        if self.iaru_region not in ["1", "2", "3"]:
+        if self.iaru_region not in VALID_IARU_REGIONS:
             raise ValueError(
                 f"Invalid IARU region: {self.iaru_region}. Must be '1', '2', or '3'"
             )
@@ -1,6 +1,7 @@
 """Constants for DX Cluster MCP Server."""
 
-from typing import Dict, Tuple
+import re
+from typing import Dict, FrozenSet, Tuple
 
 # Amateur radio band frequency ranges by IARU Region (in kHz)
 # Reference: https://www.iaru.org/
@@ -61,14 +62,23 @@ BAND_RANGES_BY_REGION: Dict[str, Dict[str, Tuple[float, float]]] = {
 BAND_RANGES = BAND_RANGES_REGION_2
 
 # Valid band names
-VALID_BANDS = list(BAND_RANGES.keys())
+VALID_BANDS: Tuple[str, ...] = tuple(BAND_RANGES.keys())
 
 # Valid IARU regions
-VALID_IARU_REGIONS = ["1", "2", "3"]
+VALID_IARU_REGIONS: FrozenSet[str] = frozenset(BAND_RANGES_BY_REGION)
+
+# Every DX spot line starts with this prefix
+DX_SPOT_PREFIX = "DX de "
+DX_SPOT_PREFIX_BYTES = DX_SPOT_PREFIX.encode("ascii")
 
 # DX spot parsing regex pattern
 # Format: DX de SPOTTER:     FREQ.F CALLSIGN  COMMENT                 HHMMZ
-DX_SPOT_PATTERN = r'DX de\s+(\S+):\s+(\d+\.?\d*)\s+(\S+)\s+(.+?)\s+(\d{4}Z)'
+# Fields are space separated; the comment is bounded to keep backtracking
+# on non-matching lines short.
+DX_SPOT_PATTERN = r'DX de +(\S+): +(\d+(?:\.\d+)?) +(\S+) +(.{1,60}?) +(\d{4}Z)'
+
+# Compiled once at import; ASCII classes keep \d to the digits float() accepts
+DX_SPOT_RE = re.compile(DX_SPOT_PATTERN, re.ASCII)
 
 # Maximum number of spots to return in a single query
 MAX_SPOTS_PER_QUERY = 100
@@ -79,6 +89,12 @@ DEFAULT_SPOTS_COUNT = 10
 # Connection settings
 DEFAULT_LOGIN_DELAY_SECONDS = 1
 INITIAL_SPOTS_WAIT_SECONDS = 3
+RECEIVE_CHUNK_SIZE = 65536  # Bytes requested per read from the cluster socket
+STREAM_READER_LIMIT = 1024 * 1024  # Transport pause threshold and max line length
+
+# Health check response caching
+HEALTH_CACHE_TTL_SECONDS = 1.0
+HEALTH_CACHE_SPOT_BUCKET = 50  # Rebuild when the cached spot count crosses a multiple
 
 # Resource URIs
 RESOURCE_URI_RECENT = "dx://spots/recent"
@@ -2,13 +2,22 @@
 
 import asyncio
 import sys
-from typing import Optional, List
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, List, Tuple
 from collections import deque
 
 from .config import DXClusterConfig
 from .models import DXSpot
-from .utils import parse_dx_spot, get_band_range
-from .constants import DEFAULT_LOGIN_DELAY_SECONDS, INITIAL_SPOTS_WAIT_SECONDS
+from .utils import parse_dx_spot, get_band_ranges_for_region
+from .constants import (
+    DEFAULT_LOGIN_DELAY_SECONDS,
+    DX_SPOT_PREFIX_BYTES,
+    INITIAL_SPOTS_WAIT_SECONDS,
+    RECEIVE_CHUNK_SIZE,
+    STREAM_READER_LIMIT,
+)
 
 
 class DXClusterClient:
@@ -29,7 +38,20 @@ class DXClusterClient:
         self.writer: Optional[asyncio.StreamWriter] = None
         self.connected = False
         self.spots_buffer: deque[DXSpot] = deque(maxlen=config.buffer_size)
+        # Buffered spots sorted by frequency, kept as parallel lists so range
+        # queries bisect over plain floats: (sequence number, spot) per entry
+        self._freq_keys: List[float] = []
+        self._freq_spots: List[Tuple[int, DXSpot]] = []
+        self._spot_seq = 0
+        # Tuple copy of spots_buffer shared by searches until the next spot
+        self._buffer_snapshot: Optional[Tuple[DXSpot, ...]] = None
         self.receive_task: Optional[asyncio.Task] = None
+        self._receive_watchdog: Optional[asyncio.TimerHandle] = None
+        self._last_receive = 0.0
+        self._receive_timed_out = False
+        self._rxbuf = bytearray()
+        self._first_spot = asyncio.Event()
+        self._bands = get_band_ranges_for_region(config.iaru_region)
 
     async def connect(self) -> bool:
         """Connect to the DX cluster.
@@ -39,7 +61,9 @@ class DXClusterClient:
         """
         try:
             self.reader, self.writer = await asyncio.wait_for(
-                asyncio.open_connection(self.config.host, self.config.port),
+                asyncio.open_connection(
+                    self.config.host, self.config.port, limit=STREAM_READER_LIMIT
+                ),
                 timeout=self.config.connection_timeout,
             )
 
@@ -53,8 +77,13 @@ class DXClusterClient:
                 file=sys.stderr
             )
 
-            # Wait for initial spots to populate
-            await asyncio.sleep(INITIAL_SPOTS_WAIT_SECONDS)
+            # Wait for initial spots to populate, but no longer than needed
+            try:
+                await asyncio.wait_for(
+                    self._first_spot.wait(), timeout=INITIAL_SPOTS_WAIT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
 
             return True
 
@@ -86,6 +115,18 @@ class DXClusterClient:
             except Exception:
                 pass
 
+    async def reconnect(self) -> bool:
+        """Re-open the connection to the DX cluster.
+
+        Buffered spots are kept, so callers holding this client keep working
+        across a dropped connection.
+
+        Returns:
+            True if connection successful, False otherwise.
+        """
+        await self.disconnect()
+        return await self.connect()
+
     async def send_command(self, command: str) -> None:
         """Send a command to the cluster.
 
@@ -110,12 +151,17 @@ class DXClusterClient:
         Returns:
             List of the most recent DXSpot objects.
         """
-        spots_list = list(self.spots_buffer)
-        return spots_list[-count:] if len(spots_list) >= count else spots_list
+        # Walk only the newest entries from the right end of the deque
+        recent = list(islice(reversed(self.spots_buffer), max(count, 0)))
+        recent.reverse()
+        return recent
 
     def search_by_callsign(self, callsign: str) -> List[DXSpot]:
         """Search for spots by callsign (partial match).
 
+        Buffered callsigns are uppercased when parsed, so only the query
+        needs normalizing.
+
         Args:
             callsign: Callsign to search for.
 
@@ -125,8 +171,8 @@ class DXClusterClient:
         callsign_upper = callsign.upper()
         return [
             spot
-            for spot in self.spots_buffer
-            if callsign_upper in spot.callsign.upper()
+            for spot in self._snapshot()
+            if callsign_upper in spot.callsign
         ]
 
     def search_by_frequency(self, min_freq: float, max_freq: float) -> List[DXSpot]:
@@ -139,11 +185,13 @@ class DXClusterClient:
         Returns:
             List of DXSpot objects within the range.
         """
-        return [
-            spot
-            for spot in self.spots_buffer
-            if min_freq <= spot.frequency <= max_freq
-        ]
+        lo = bisect_left(self._freq_keys, min_freq)
+        hi = bisect_right(self._freq_keys, max_freq)
+
+        # Return matches in arrival order, like the buffer itself
+        matches = self._freq_spots[lo:hi]
+        matches.sort(key=itemgetter(0))
+        return [spot for _, spot in matches]
 
     def get_band_spots(self, band: str) -> List[DXSpot]:
         """Get spots for a specific amateur radio band.
@@ -154,7 +202,7 @@ class DXClusterClient:
         Returns:
             List of DXSpot objects for the specified band.
         """
-        band_range = get_band_range(band, self.config.iaru_region)
+        band_range = self._bands.get(band)
         if not band_range:
             return []
 
@@ -176,6 +224,46 @@ class DXClusterClient:
             "cached_spots": len(self.spots_buffer),
         }
 
+    def _snapshot(self) -> Tuple[DXSpot, ...]:
+        """Get a frozen copy of the buffer for filtering.
+
+        Iterating a tuple is cheaper than walking the deque's linked blocks,
+        and the copy is unaffected by spots appended while it is in use. The
+        copy is reused by every search until the next spot arrives.
+
+        Returns:
+            Tuple of buffered spots, oldest first.
+        """
+        if self._buffer_snapshot is None:
+            self._buffer_snapshot = tuple(self.spots_buffer)
+        return self._buffer_snapshot
+
+    def _add_spot(self, spot: DXSpot) -> None:
+        """Append a spot to the buffer and keep the frequency index in sync.
+
+        Args:
+            spot: Newly received spot.
+        """
+        buffer = self.spots_buffer
+        keys = self._freq_keys
+        entries = self._freq_spots
+
+        if len(buffer) == buffer.maxlen:
+            evicted_seq = self._spot_seq - len(buffer)
+            i = bisect_left(keys, buffer[0].frequency)
+            while entries[i][0] != evicted_seq:
+                i += 1
+            del keys[i]
+            del entries[i]
+
+        buffer.append(spot)
+        self._buffer_snapshot = None
+        i = bisect_right(keys, spot.frequency)
+        keys.insert(i, spot.frequency)
+        entries.insert(i, (self._spot_seq, spot))
+        self._spot_seq += 1
+        self._first_spot.set()
+
     async def _authenticate(self) -> None:
         """Authenticate with the DX cluster."""
         await asyncio.sleep(DEFAULT_LOGIN_DELAY_SECONDS)
@@ -186,29 +274,85 @@ class DXClusterClient:
         """Start the background task to receive spots."""
         self.receive_task = asyncio.create_task(self._receive_loop())
 
+    def _check_receive_timeout(self) -> None:
+        """Cancel the receive loop if nothing arrived within the receive timeout.
+
+        Re-arms itself for the remaining time when data was received since the
+        watchdog was scheduled.
+        """
+        loop = asyncio.get_running_loop()
+        remaining = self._last_receive + self.config.receive_timeout - loop.time()
+
+        if remaining > 0:
+            self._receive_watchdog = loop.call_later(
+                remaining, self._check_receive_timeout
+            )
+            return
+
+        self._receive_timed_out = True
+        if self.receive_task:
+            self.receive_task.cancel()
+
     async def _receive_loop(self) -> None:
-        """Background task to receive and parse spots."""
+        """Background task to receive and parse spots.
+
+        Data is read in chunks into a reusable buffer and every complete line
+        in a chunk is handled before awaiting again, instead of resuming once
+        per line. Only lines containing ``DX de`` are copied out and decoded,
+        and a line longer than ``STREAM_READER_LIMIT`` ends the loop.
+        The receive timeout is enforced by a single watchdog timer rather than
+        wrapping every read in ``asyncio.wait_for``.
+        """
+        loop = asyncio.get_running_loop()
+        self._last_receive = loop.time()
+        self._receive_timed_out = False
+        self._receive_watchdog = loop.call_later(
+            self.config.receive_timeout, self._check_receive_timeout
+        )
+        rxbuf = self._rxbuf
+        rxbuf.clear()
+        # Offset up to which rxbuf is known to hold no newline
+        scan = 0
+
         try:
             while self.connected and self.reader:
-                line = await asyncio.wait_for(
-                    self.reader.readline(),
-                    timeout=self.config.receive_timeout,
-                )
+                chunk = await self.reader.read(RECEIVE_CHUNK_SIZE)
 
-                if not line:
+                if not chunk:
                     break
 
-                decoded = line.decode("utf-8", errors="ignore").strip()
-                if decoded:
-                    spot = parse_dx_spot(decoded)
-                    if spot:
-                        self.spots_buffer.append(spot)
+                self._last_receive = loop.time()
+                rxbuf += chunk
+
+                # Walk complete lines by offset and compact the buffer once
+                start = 0
+                while (end := rxbuf.find(b"\n", scan)) != -1:
+                    # Skip banners and announcements without copying. Spots
+                    # may follow a prompt, a bell or indentation on the line
+                    if rxbuf.find(DX_SPOT_PREFIX_BYTES, start, end) != -1:
+                        line = rxbuf[start:end].decode("utf-8", errors="ignore")
+                        spot = parse_dx_spot(line.strip())
+                        if spot:
+                            self._add_spot(spot)
+                    start = scan = end + 1
+
+                del rxbuf[:start]
+                scan = len(rxbuf)
+
+                # Stop on an unterminated line, as readline() did at its limit
+                if scan > STREAM_READER_LIMIT:
+                    print(
+                        f"Line exceeds {STREAM_READER_LIMIT} bytes without a newline",
+                        file=sys.stderr,
+                    )
+                    rxbuf.clear()
+                    break
 
-        except asyncio.TimeoutError:
-            print("Receive timeout - connection may be stale", file=sys.stderr)
         except asyncio.CancelledError:
-            pass
+            if self._receive_timed_out:
+                print("Receive timeout - connection may be stale", file=sys.stderr)
         except Exception as e:
             print(f"Error in receive loop: {e}", file=sys.stderr)
         finally:
+            self._receive_watchdog.cancel()
             self.connected = False
@@ -1,8 +1,8 @@
 """MCP tool and resource handlers for DX Cluster server."""
 
-import json
 from typing import Any, List
 
+import orjson
 from mcp.types import Resource, Tool, TextContent
 
 from .dx_client import DXClusterClient
@@ -16,6 +16,16 @@ from .constants import (
     RESOURCE_URI_ALL,
 )
 
+# Constant "no results" responses, shared instead of rebuilt on every miss
+_NO_RECENT_SPOTS = TextContent(
+    type="text",
+    text="No spots available yet. The cluster may still be loading, or there may be no recent activity.",
+)
+_NO_BAND_SPOTS = {
+    band: TextContent(type="text", text=f"No spots found for {band} band")
+    for band in VALID_BANDS
+}
+
 
 class MCPResourceHandler:
     """Handles MCP resource requests."""
@@ -27,6 +37,7 @@ class MCPResourceHandler:
             client: DX cluster client instance.
         """
         self.client = client
+        self._resources = self._build_resources()
 
     def list_resources(self) -> List[Resource]:
         """List available resources.
@@ -34,6 +45,11 @@ class MCPResourceHandler:
         Returns:
             List of Resource objects.
         """
+        return self._resources
+
+    @staticmethod
+    def _build_resources() -> List[Resource]:
+        """Build the resource list; it is constant for the handler's lifetime."""
         return [
             Resource(
                 uri=RESOURCE_URI_RECENT,
@@ -63,11 +79,11 @@ class MCPResourceHandler:
         """
         if uri == RESOURCE_URI_RECENT:
             spots = self.client.get_recent_spots(20)
-            return json.dumps([spot.to_dict() for spot in spots], indent=2)
+            return orjson.dumps(spots, option=orjson.OPT_INDENT_2).decode()
 
         elif uri == RESOURCE_URI_ALL:
             spots = list(self.client.spots_buffer)
-            return json.dumps([spot.to_dict() for spot in spots], indent=2)
+            return orjson.dumps(spots, option=orjson.OPT_INDENT_2).decode()
 
         else:
             raise ValueError(f"Unknown resource: {uri}")
@@ -83,6 +99,14 @@ class MCPToolHandler:
             client: DX cluster client instance.
         """
         self.client = client
+        self._handlers = {
+            "get_recent_spots": self._handle_get_recent_spots,
+            "search_by_callsign": self._handle_search_by_callsign,
+            "search_by_frequency": self._handle_search_by_frequency,
+            "get_band_spots": self._handle_get_band_spots,
+            "get_cluster_status": self._handle_get_cluster_status,
+        }
+        self._tools = self._build_tools()
 
     def list_tools(self) -> List[Tool]:
         """List available tools.
@@ -90,6 +114,11 @@ class MCPToolHandler:
         Returns:
             List of Tool objects.
         """
+        return self._tools
+
+    @staticmethod
+    def _build_tools() -> List[Tool]:
+        """Build the tool list; it is constant for the handler's lifetime."""
         return [
             Tool(
                 name="get_recent_spots",
@@ -146,7 +175,7 @@ class MCPToolHandler:
                         "band": {
                             "type": "string",
                             "description": "Ham radio band (e.g., '20m', '40m', '80m')",
-                            "enum": VALID_BANDS,
+                            "enum": list(VALID_BANDS),
                         }
                     },
                     "required": ["band"],
@@ -175,15 +204,7 @@ class MCPToolHandler:
         Raises:
             ValueError: If tool name is unknown.
         """
-        handlers = {
-            "get_recent_spots": self._handle_get_recent_spots,
-            "search_by_callsign": self._handle_search_by_callsign,
-            "search_by_frequency": self._handle_search_by_frequency,
-            "get_band_spots": self._handle_get_band_spots,
-            "get_cluster_status": self._handle_get_cluster_status,
-        }
-
-        handler = handlers.get(name)
+        handler = self._handlers.get(name)
         if not handler:
             raise ValueError(f"Unknown tool: {name}")
 
@@ -195,12 +216,7 @@ class MCPToolHandler:
         spots = self.client.get_recent_spots(count)
 
         if not spots:
-            return [
-                TextContent(
-                    type="text",
-                    text="No spots available yet. The cluster may still be loading, or there may be no recent activity.",
-                )
-            ]
+            return [_NO_RECENT_SPOTS]
 
         result = format_spot_list(spots, f"Found {len(spots)} recent spots:")
         return [TextContent(type="text", text=result)]
@@ -256,7 +272,7 @@ class MCPToolHandler:
         spots = self.client.get_band_spots(band)
 
         if not spots:
-            return [TextContent(type="text", text=f"No spots found for {band} band")]
+            return [_NO_BAND_SPOTS[band]]
 
         result = format_spot_list(spots, f"Found {len(spots)} spots on {band} band:")
         return [TextContent(type="text", text=result)]
@@ -1,21 +1,22 @@
 """Data models for DX Cluster MCP Server."""
 
+from dataclasses import dataclass
 from typing import Dict, Any
-from pydantic import BaseModel, Field
 
 
-class DXSpot(BaseModel):
+@dataclass(slots=True)
+class DXSpot:
     """Represents a DX spot from the cluster.
 
     A DX spot contains information about a station that was heard
     on a specific frequency, including who spotted it and when.
     """
 
-    callsign: str = Field(description="The DX station callsign")
-    frequency: float = Field(description="Frequency in kHz")
-    spotter: str = Field(description="Callsign of the spotter")
-    time: str = Field(description="Time of the spot (HHMMZ format)")
-    comment: str = Field(default="", description="Additional comment or mode information")
+    callsign: str  # The DX station callsign
+    frequency: float  # Frequency in kHz
+    spotter: str  # Callsign of the spotter
+    time: str  # Time of the spot (HHMMZ format)
+    comment: str = ""  # Additional comment or mode information
 
     def to_string(self) -> str:
         """Format spot as a human-readable string.
@@ -23,11 +24,11 @@ class DXSpot(BaseModel):
         Returns:
             Formatted string representation of the spot.
         """
-        comment_part = f" - {self.comment}" if self.comment else ""
-        return (
+        base = (
             f"{self.callsign} on {self.frequency} kHz "
-            f"spotted by {self.spotter} at {self.time}{comment_part}"
+            f"spotted by {self.spotter} at {self.time}"
         )
+        return base + " - " + self.comment if self.comment else base
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert spot to dictionary.
@@ -35,18 +36,28 @@ class DXSpot(BaseModel):
         Returns:
             Dictionary representation of the spot.
         """
-        return self.model_dump()
+        return {
+            "callsign": self.callsign,
+            "frequency": self.frequency,
+            "spotter": self.spotter,
+            "time": self.time,
+            "comment": self.comment,
+        }
+
+    # Kept for callers written against the former pydantic model
+    model_dump = to_dict
 
 
-class ClusterStatus(BaseModel):
+@dataclass(slots=True)
+class ClusterStatus:
     """Represents the status of the DX cluster connection."""
 
-    connected: bool = Field(description="Whether connected to the cluster")
-    host: str = Field(description="Hostname of the cluster")
-    port: int = Field(description="Port number")
-    callsign: str = Field(description="Callsign used for connection")
-    iaru_region: str = Field(description="IARU region (1, 2, or 3)")
-    cached_spots: int = Field(description="Number of spots in the buffer")
+    connected: bool  # Whether connected to the cluster
+    host: str  # Hostname of the cluster
+    port: int  # Port number
+    callsign: str  # Callsign used for connection
+    iaru_region: str  # IARU region (1, 2, or 3)
+    cached_spots: int  # Number of spots in the buffer
 
     def to_string(self) -> str:
         """Format status as a human-readable string.
@@ -1,10 +1,13 @@
 """OAuth authentication for the DX Cluster MCP Server."""
 
+import hmac
 import os
 import secrets
-from typing import Optional
+from typing import Any, Dict, Optional
+
+import orjson
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 
 class OAuthConfig:
@@ -42,6 +45,21 @@ class OAuthConfig:
         return True
 
 
+def _json_response(status_code: int, content: Dict[str, Any]) -> Response:
+    """Build a JSON response serialized with orjson.
+
+    Args:
+        status_code: HTTP status code.
+        content: JSON-serializable response body.
+
+    Returns:
+        The response object.
+    """
+    return Response(
+        orjson.dumps(content), status_code=status_code, media_type="application/json"
+    )
+
+
 def extract_bearer_token(request: Request) -> Optional[str]:
     """Extract bearer token from request.
 
@@ -70,8 +88,9 @@ async def validate_oauth_middleware(request: Request, call_next, oauth_config: O
     Returns:
         The response from the next handler or an error response.
     """
-    # Skip authentication for health check endpoint
-    if request.url.path == "/health":
+    # Skip authentication for health check endpoint; read the raw ASGI path
+    # rather than building a URL object
+    if request.scope["path"] == "/health":
         return await call_next(request)
 
     # If OAuth is disabled, allow all requests
@@ -82,7 +101,7 @@ async def validate_oauth_middleware(request: Request, call_next, oauth_config: O
     token = extract_bearer_token(request)
 
     if not token:
-        return JSONResponse(
+        return _json_response(
             status_code=401,
             content={
                 "error": "unauthorized",
@@ -91,9 +110,9 @@ async def validate_oauth_middleware(request: Request, call_next, oauth_config: O
             }
         )
 
-    # Validate token matches client secret
-    if token != oauth_config.client_secret:
-        return JSONResponse(
+    # Validate token matches client secret (constant-time comparison)
+    if not hmac.compare_digest(token.encode(), oauth_config.client_secret.encode()):
+        return _json_response(
             status_code=403,
             content={
                 "error": "forbidden",
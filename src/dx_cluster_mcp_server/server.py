@@ -12,55 +12,95 @@ Supports two transport modes:
 
 import asyncio
 import os
-from typing import Any, Optional
+import time
+from typing import Any, Optional, Tuple
 
+import orjson
 from mcp.server import Server
 from mcp.types import Resource, Tool, TextContent
 import mcp.server.stdio
 
 from .config import DXClusterConfig
+from .constants import HEALTH_CACHE_SPOT_BUCKET, HEALTH_CACHE_TTL_SECONDS
 from .dx_client import DXClusterClient
 from .mcp_handlers import MCPResourceHandler, MCPToolHandler
 from .oauth import OAuthConfig, validate_oauth_middleware
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 
 # Global client instance
+_config: Optional[DXClusterConfig] = None
 _dx_client: Optional[DXClusterClient] = None
 _resource_handler: Optional[MCPResourceHandler] = None
 _tool_handler: Optional[MCPToolHandler] = None
 
+# Serializes connection setup so concurrent first calls open one session
+_client_lock = asyncio.Lock()
 
-async def get_client() -> DXClusterClient:
-    """Get or create the DX cluster client.
+# Cached /health body: (body, built at, connected, spot count bucket)
+_health_cache: Optional[Tuple[bytes, float, bool, int]] = None
+
+
+def get_config() -> DXClusterConfig:
+    """Get the cluster configuration, reading the environment once.
 
     Returns:
-        DXClusterClient instance.
+        Validated DXClusterConfig instance.
 
     Raises:
-        RuntimeError: If connection to DX cluster fails.
+        ValueError: If the configuration is invalid.
     """
-    global _dx_client, _resource_handler, _tool_handler
+    global _config
 
-    if _dx_client is None or not _dx_client.connected:
+    if _config is None:
         config = DXClusterConfig.from_environment()
         config.validate()
+        _config = config
 
-        _dx_client = DXClusterClient(config)
-        success = await _dx_client.connect()
-
-        if not success:
-            _dx_client = None
-            raise RuntimeError(
-                f"Failed to connect to DX cluster at {config.host}:{config.port}. "
-                f"Please verify:\n"
-                f"  1. DX_CLUSTER_HOST and DX_CLUSTER_PORT are correct\n"
-                f"  2. DX_CLUSTER_CALLSIGN is set to a valid callsign\n"
-                f"  3. The DX cluster server is reachable from your network\n"
-                f"  4. Firewall allows outbound connections to port {config.port}"
-            )
+    return _config
+
+
+async def get_client() -> DXClusterClient:
+    """Get the DX cluster client, connecting or reconnecting as needed.
 
-        _resource_handler = MCPResourceHandler(_dx_client)
-        _tool_handler = MCPToolHandler(_dx_client)
+    The client and its handlers are created once; a dropped connection is
+    re-opened on the same client so buffered spots are kept.
+
+    Returns:
+        DXClusterClient instance.
+
+    Raises:
+        RuntimeError: If connection to DX cluster fails.
+    """
+    global _dx_client, _resource_handler, _tool_handler
+
+    if _dx_client is not None and _dx_client.connected:
+        return _dx_client
+
+    async with _client_lock:
+        # Another caller may have connected while we waited for the lock
+        if _dx_client is None:
+            _dx_client = DXClusterClient(get_config())
+            _resource_handler = MCPResourceHandler(_dx_client)
+            _tool_handler = MCPToolHandler(_dx_client)
+
+        if not _dx_client.connected:
+            success = await _dx_client.reconnect()
+
+            if not success:
+                config = _dx_client.config
+                raise RuntimeError(
+                    f"Failed to connect to DX cluster at {config.host}:{config.port}. "
+                    f"Please verify:\n"
+                    f"  1. DX_CLUSTER_HOST and DX_CLUSTER_PORT are correct\n"
+                    f"  2. DX_CLUSTER_CALLSIGN is set to a valid callsign\n"
+                    f"  3. The DX cluster server is reachable from your network\n"
+                    f"  4. Firewall allows outbound connections to port {config.port}"
+                )
 
     return _dx_client
 
@@ -143,7 +183,7 @@ async def main_sse() -> None:
     from mcp.server.sse import SseServerTransport
     from starlette.applications import Starlette
     from starlette.routing import Route
-    from starlette.responses import JSONResponse
+    from starlette.responses import Response
     import uvicorn
 
     # Initialize OAuth configuration
@@ -165,25 +205,43 @@ async def main_sse() -> None:
         await sse.handle_post_message(scope, receive, send)
 
     async def health_check(request):
-        """Simple health check endpoint with DX cluster connection status."""
-        global _dx_client
+        """Simple health check endpoint with DX cluster connection status.
+
+        The serialized body is cached and only rebuilt when the connection
+        state or spot count bucket changes, or the cache is older than
+        HEALTH_CACHE_TTL_SECONDS.
+        """
+        global _dx_client, _health_cache
 
         # Check DX cluster connection
         cluster_connected = False
-        cluster_info = None
+        spots_bucket = -1
 
         if _dx_client is not None:
             cluster_connected = _dx_client.connected
-            if cluster_connected:
-                cluster_info = {
-                    "host": _dx_client.config.host,
-                    "port": _dx_client.config.port,
-                    "callsign": _dx_client.config.callsign,
-                    "iaru_region": _dx_client.config.iaru_region,
-                    "cached_spots": len(_dx_client.spots_buffer)
-                }
-
-        return JSONResponse({
+            spots_bucket = len(_dx_client.spots_buffer) // HEALTH_CACHE_SPOT_BUCKET
+
+        now = time.monotonic()
+        if _health_cache is not None:
+            body, built_at, cached_connected, cached_bucket = _health_cache
+            if (
+                cached_connected == cluster_connected
+                and cached_bucket == spots_bucket
+                and now - built_at < HEALTH_CACHE_TTL_SECONDS
+            ):
+                return Response(body, media_type="application/json")
+
+        cluster_info = None
+        if cluster_connected:
+            cluster_info = {
+                "host": _dx_client.config.host,
+                "port": _dx_client.config.port,
+                "callsign": _dx_client.config.callsign,
+                "iaru_region": _dx_client.config.iaru_region,
+                "cached_spots": len(_dx_client.spots_buffer)
+            }
+
+        body = orjson.dumps({
             "status": "healthy",
             "service": "dx-cluster-mcp-server",
             "version": "0.1.0",
@@ -198,6 +256,8 @@ async def main_sse() -> None:
                 "messages": "/messages"
             }
         })
+        _health_cache = (body, now, cluster_connected, spots_bucket)
+        return Response(body, media_type="application/json")
 
     # Create Starlette app (only for health check)
     starlette_app = Starlette(
@@ -206,14 +266,16 @@ async def main_sse() -> None:
         ]
     )
 
-    # Add OAuth middleware to Starlette app
-    from starlette.middleware.base import BaseHTTPMiddleware
+    # Add OAuth middleware to Starlette app; with OAuth disabled it would let
+    # every request through, so skip the per-request middleware hop entirely
+    if oauth_config.enabled:
+        from starlette.middleware.base import BaseHTTPMiddleware
 
-    class OAuthMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request, call_next):
-            return await validate_oauth_middleware(request, call_next, oauth_config)
+        class OAuthMiddleware(BaseHTTPMiddleware):
+            async def dispatch(self, request, call_next):
+                return await validate_oauth_middleware(request, call_next, oauth_config)
 
-    starlette_app.add_middleware(OAuthMiddleware)
+        starlette_app.add_middleware(OAuthMiddleware)
 
     # Create ASGI middleware to intercept SSE paths
     async def asgi_app(scope, receive, send):
@@ -263,11 +325,12 @@ async def main_sse() -> None:
         print(f"  Server endpoints are publicly accessible")
         print(f"  Set OAUTH_ENABLED=true to enable authentication")
 
-    # Run server
+    # Run server; serve() uses the running loop, which run() selects
     config = uvicorn.Config(
         asgi_app,
         host=host,
         port=port,
+        ws="none",  # No WebSocket routes; skip loading the websockets stack
         log_level="info",
         ssl_certfile=ssl_certfile,
         ssl_keyfile=ssl_keyfile,
@@ -280,13 +343,15 @@ def run() -> None:
     """Entry point for the server.
 
     Runs in stdio mode by default, or SSE mode if MCP_TRANSPORT=sse.
+    Uses the uvloop event loop when it is installed.
     """
     transport = os.getenv("MCP_TRANSPORT", "stdio").lower()
+    run_loop = uvloop.run if uvloop is not None else asyncio.run
 
     if transport == "sse":
-        asyncio.run(main_sse())
+        run_loop(main_sse())
     else:
-        asyncio.run(main_stdio())
+        run_loop(main_stdio())
 
 
 if __name__ == "__main__":
@@ -1,44 +1,111 @@
 """Utility functions for DX Cluster MCP Server."""
 
-import re
+import sys
+from functools import lru_cache
 from typing import Optional, Tuple, Dict
 
 from .models import DXSpot
-from .constants import DX_SPOT_PATTERN, BAND_RANGES_BY_REGION, BAND_RANGES
+from .constants import DX_SPOT_PREFIX, DX_SPOT_RE, BAND_RANGES_BY_REGION, BAND_RANGES
+
+# Prefix for each spot in formatted listings
+_BULLET = "• "
+
+
+def _is_ascii_digits(token: str) -> bool:
+    """Check whether a token consists only of ASCII digits."""
+    # str.isdigit alone also accepts digits such as "²" that float() rejects
+    return token.isascii() and token.isdigit()
+
+
+def _is_spot_time(token: str) -> bool:
+    """Check whether a token is a spot time in HHMMZ format."""
+    return len(token) == 5 and token[4] == "Z" and _is_ascii_digits(token[:4])
+
+
+def _split_last_field(text: str) -> Tuple[str, str]:
+    """Split off the last whitespace-separated field of a string."""
+    fields = text.rsplit(None, 1)
+    if len(fields) == 2:
+        return fields[0], fields[1]
+    return "", fields[0] if fields else ""
+
+
+def _make_spot(
+    spotter: str, frequency: float, callsign: str, comment: str, time: str
+) -> DXSpot:
+    """Build a DXSpot from parsed fields, normalizing the callsigns."""
+    # Spotters and DX stations repeat a lot; share one string per callsign
+    return DXSpot(
+        callsign=sys.intern(callsign.upper()),
+        frequency=frequency,
+        spotter=sys.intern(spotter),
+        time=time,
+        comment=comment.strip(),
+    )
+
+
+def _tokenize_dx_spot(line: str) -> Optional[DXSpot]:
+    """Parse a spot line that starts with ``DX de`` using string operations."""
+    if not line.startswith(DX_SPOT_PREFIX):
+        return None
+
+    spotter, sep, rest = line[len(DX_SPOT_PREFIX):].partition(":")
+    spotter = spotter.strip()
+    if not sep or not spotter:
+        return None
+
+    fields = rest.split(None, 2)
+    if len(fields) < 3:
+        return None
+    frequency, callsign, tail = fields
+
+    if not _is_ascii_digits(frequency.replace(".", "", 1)):
+        return None
+
+    comment, time = _split_last_field(tail)
+    if not _is_spot_time(time):
+        # Some clusters append a grid locator after the time
+        comment, time = _split_last_field(comment)
+        if not _is_spot_time(time):
+            return None
+
+    return _make_spot(spotter, float(frequency), callsign, comment, time)
+
+
+def _match_dx_spot(line: str) -> Optional[DXSpot]:
+    """Parse a spot line with the DX spot regex, anywhere in the line."""
+    # Every match contains the literal prefix, and a substring test is far
+    # cheaper than letting the regex scan chatter lines
+    if DX_SPOT_PREFIX not in line:
+        return None
+
+    match = DX_SPOT_RE.search(line)
+
+    if not match:
+        return None
+
+    # The ASCII-only frequency group always holds a valid float literal
+    spotter, frequency, callsign, comment, time = match.groups()
+    return _make_spot(spotter, float(frequency), callsign, comment, time)
 
 
 def parse_dx_spot(line: str) -> Optional[DXSpot]:
     """Parse a DX spot line from the cluster.
 
+    Spot lines have the fixed shape ``DX de SPOTTER: FREQ CALLSIGN COMMENT HHMMZ``,
+    so they are tokenized with plain string operations. Lines the tokenizer
+    rejects, such as spots preceded by a prompt, fall back to the regex.
+
     Args:
         line: Raw line from the DX cluster.
 
     Returns:
         DXSpot object if parsing succeeds, None otherwise.
     """
-    match = re.search(DX_SPOT_PATTERN, line)
-
-    if not match:
-        return None
-
-    try:
-        spotter = match.group(1)
-        frequency = float(match.group(2))
-        callsign = match.group(3)
-        comment = match.group(4).strip()
-        time = match.group(5)
-
-        return DXSpot(
-            callsign=callsign,
-            frequency=frequency,
-            spotter=spotter,
-            time=time,
-            comment=comment,
-        )
-    except (ValueError, IndexError):
-        return None
+    return _tokenize_dx_spot(line) or _match_dx_spot(line)
 
 
+@lru_cache(maxsize=8)
 def get_band_ranges_for_region(region: str) -> Dict[str, Tuple[float, float]]:
     """Get band ranges for a specific IARU region.
 
@@ -51,6 +118,7 @@ def get_band_ranges_for_region(region: str) -> Dict[str, Tuple[float, float]]:
     return BAND_RANGES_BY_REGION.get(region, BAND_RANGES_BY_REGION["2"])
 
 
+@lru_cache(maxsize=64)
 def get_band_range(band: str, region: str = "2") -> Optional[Tuple[float, float]]:
     """Get frequency range for a given band in a specific region.
 
@@ -105,12 +173,6 @@ def format_spot_list(spots: list[DXSpot], title: str = "") -> str:
     if not spots:
         return "No spots found."
 
-    lines = []
-    if title:
-        lines.append(title)
-        lines.append("")
-
-    for spot in spots:
-        lines.append(f"• {spot.to_string()}")
-
-    return "\n".join(lines)
+    header = f"{title}\n\n" if title else ""
+    # A list lets join size the result in one pass, unlike a generator
+    return header + "\n".join([_BULLET + spot.to_string() for spot in spots])
@@ -5,8 +5,13 @@ Test MCP client to connect to the DX Cluster MCP Server via SSE.
 This demonstrates how to properly connect to the MCP server over HTTP/SSE.
 """
 
+import argparse
 import asyncio
 import sys
+import time
+
+import aiohttp
+import orjson
 
 
 async def test_mcp_connection(server_url: str = "http://localhost:8000"):
@@ -69,55 +74,81 @@ async def test_mcp_connection(server_url: str = "http://localhost:8000"):
         sys.exit(1)
 
 
-async def test_health_check(server_url: str = "http://localhost:8000"):
+async def test_health_check(server_url: str = "http://localhost:8000", session=None):
     """Test the health check endpoint.
 
     Args:
         server_url: URL of the MCP server (default: http://localhost:8000)
+        session: Optional aiohttp.ClientSession to reuse; a temporary one is
+            created when omitted.
     """
-    import aiohttp
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await test_health_check(server_url, own_session)
 
     try:
         health_url = f"{server_url}/health"
         print(f"Checking health endpoint: {health_url}")
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(health_url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    print("✓ MCP Server is healthy!")
-                    print(f"  Service: {data.get('service')}")
-                    print(f"  Version: {data.get('version')}")
-                    print(f"  Transport: {data.get('transport')}")
-
-                    # Check DX cluster connection
-                    dx_cluster = data.get('dx_cluster', {})
-                    cluster_connected = dx_cluster.get('connected', False)
-
-                    print(f"\n  DX Cluster Connection:")
-                    if cluster_connected:
-                        info = dx_cluster.get('info', {})
-                        print(f"    ✓ Connected to {info.get('host')}:{info.get('port')}")
-                        print(f"    Callsign: {info.get('callsign')}")
-                        print(f"    IARU Region: {info.get('iaru_region')}")
-                        print(f"    Cached spots: {info.get('cached_spots')}")
-                    else:
-                        print(f"    ⚠ Not connected to DX cluster yet")
-                        print(f"    (Connection happens on first MCP request)")
-
-                    return True  # Server is healthy
+        async with session.get(health_url) as response:
+            if response.status == 200:
+                data = orjson.loads(await response.read())
+                print("✓ MCP Server is healthy!")
+                print(f"  Service: {data.get('service')}")
+                print(f"  Version: {data.get('version')}")
+                print(f"  Transport: {data.get('transport')}")
+
+                # Check DX cluster connection
+                dx_cluster = data.get('dx_cluster', {})
+                cluster_connected = dx_cluster.get('connected', False)
+
+                print(f"\n  DX Cluster Connection:")
+                if cluster_connected:
+                    info = dx_cluster.get('info', {})
+                    print(f"    ✓ Connected to {info.get('host')}:{info.get('port')}")
+                    print(f"    Callsign: {info.get('callsign')}")
+                    print(f"    IARU Region: {info.get('iaru_region')}")
+                    print(f"    Cached spots: {info.get('cached_spots')}")
                 else:
-                    print(f"✗ Health check failed with status: {response.status}")
-                    return False
+                    print(f"    ⚠ Not connected to DX cluster yet")
+                    print(f"    (Connection happens on first MCP request)")
+
+                return True  # Server is healthy
+            else:
+                print(f"✗ Health check failed with status: {response.status}")
+                return False
     except Exception as e:
         print(f"✗ Could not connect to server: {e}")
         return False
 
 
+async def poll_health_check(server_url: str, session, count: int):
+    """Hit the health check endpoint repeatedly over one pooled session.
+
+    Args:
+        server_url: URL of the MCP server
+        session: aiohttp.ClientSession whose connections are reused
+        count: Number of requests to send
+    """
+    health_url = f"{server_url}/health"
+    failures = 0
+
+    start = time.perf_counter()
+    for _ in range(count):
+        async with session.get(health_url) as response:
+            await response.read()
+            if response.status != 200:
+                failures += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"\nPolled {health_url} {count} times")
+    print(f"  Average: {elapsed / count * 1000:.2f} ms per request")
+    if failures:
+        print(f"  ✗ {failures} requests failed")
+
+
 async def main():
     """Run tests."""
-    import argparse
-
     parser = argparse.ArgumentParser(description="Test MCP DX Cluster Server")
     parser.add_argument(
         "--url",
@@ -129,6 +160,13 @@ async def main():
         action="store_true",
         help="Only test health check endpoint"
     )
+    parser.add_argument(
+        "--poll",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Hit the health check endpoint N more times and report the average request time"
+    )
 
     args = parser.parse_args()
 
@@ -137,13 +175,18 @@ async def main():
     print("=" * 60)
     print()
 
-    # First, test health check
-    health_ok = await test_health_check(args.url)
+    # First, test health check; one pooled session serves all HTTP requests
+    connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        health_ok = await test_health_check(args.url, session)
 
-    if not health_ok:
-        print("\n⚠ Server is not responding. Is the server running?")
-        print("Start the server with: docker-compose up")
-        sys.exit(1)
+        if not health_ok:
+            print("\n⚠ Server is not responding. Is the server running?")
+            print("Start the server with: docker-compose up")
+            sys.exit(1)
+
+        if args.poll > 0:
+            await poll_health_check(args.url, session, args.poll)
 
     if args.health_only:
         print("\n✓ Health check passed!")
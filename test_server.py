@@ -5,9 +5,6 @@ import sys
 import asyncio
 from typing import List
 
-# Add src to path
-sys.path.insert(0, '/home/user/dx_cluster_mcp_server/src')
-
 
 def test_imports():
     """Test that all modules can be imported."""
@@ -54,6 +51,11 @@ def test_models():
         spot_str = spot.to_string()
         assert "K1ABC" in spot_str
         assert "14074.0" in spot_str
+        assert not hasattr(spot, "__dict__"), "DXSpot should use __slots__"
+        spot.comment = "SSB"
+        assert spot.to_string().endswith(" - SSB")
+        from dataclasses import asdict
+        assert asdict(spot) == spot.to_dict()
         print(f"  DXSpot: {spot_str}")
 
         # Test ClusterStatus
@@ -97,6 +99,32 @@ def test_utils():
         assert spot.spotter == "W1AW"
         print(f"  Parsed spot: {spot.to_string()}")
 
+        # Spots followed by a grid locator and non-spot lines
+        locator_line = "DX de EA4URE-#:  7074.0  ea8xyz  FT8 -12 dB      2201Z IL18"
+        spot = parse_dx_spot(locator_line)
+        assert spot is not None
+        assert spot.callsign == "EA8XYZ"
+        assert spot.time == "2201Z"
+        assert spot.comment == "FT8 -12 dB"
+        tab_line = "DX de W3LPL:\t14025.0\tJA1ABC\tCW\t1235Z"
+        spot = parse_dx_spot(tab_line)
+        assert spot is not None
+        assert spot.callsign == "JA1ABC"
+        assert spot.time == "1235Z"
+        assert spot.comment == "CW"
+        assert parse_dx_spot("WWV de W0MU <18>:   SFI=70, A=5, K=1") is None
+        # Prompt-prefixed lines reach the parser from the receive loop
+        prompt_line = "W1AW de N0CALL 1234Z >DX de W1AW:  14025.0  JA1ABC  CW 599  1235Z"
+        spot = parse_dx_spot(prompt_line)
+        assert spot is not None
+        assert spot.callsign == "JA1ABC"
+        assert spot.time == "1235Z"
+        assert parse_dx_spot("DX de W1AW:     abc  K1ABC     FT8 1234Z") is None
+        assert parse_dx_spot("DX de W1AW:  \u00b2  K1ABC  FT8  1234Z") is None
+        assert parse_dx_spot("DX de W1AW:  1\u0661  K1ABC  FT8  1234Z") is None
+        assert parse_dx_spot("DX de W1AW:  14074.0  K1ABC  FT8  12\u00b34Z") is None
+        print("  Locator and non-spot lines handled")
+
         # Test band validation
         assert validate_band("20m") == True
         assert validate_band("99m") == False
@@ -198,13 +226,17 @@ def test_dx_client_structure():
         client = DXClusterClient(config)
 
         # Check client has required methods
-        assert hasattr(client, "connect")
-        assert hasattr(client, "disconnect")
-        assert hasattr(client, "get_recent_spots")
-        assert hasattr(client, "search_by_callsign")
-        assert hasattr(client, "search_by_frequency")
-        assert hasattr(client, "get_band_spots")
-        assert hasattr(client, "get_status")
+        required = {
+            "connect",
+            "disconnect",
+            "get_recent_spots",
+            "search_by_callsign",
+            "search_by_frequency",
+            "get_band_spots",
+            "get_status",
+        }
+        missing = required - set(dir(client))
+        assert not missing, f"Missing methods: {missing}"
 
         print("  Client has all required methods")
 
@@ -213,6 +245,34 @@ def test_dx_client_structure():
         assert len(client.spots_buffer) == 0
         print("  Spots buffer initialized")
 
+        # Test frequency search over a full buffer
+        from dx_cluster_mcp_server.models import DXSpot
+
+        small_client = DXClusterClient(
+            DXClusterConfig(
+                host="test.example.com", port=7300, callsign="TEST", buffer_size=3
+            )
+        )
+        for callsign, frequency in [
+            ("K1AAA", 14074.0),
+            ("K1BBB", 7074.0),
+            ("K1CCC", 14200.0),
+            ("K1DDD", 14074.0),
+        ]:
+            small_client._add_spot(
+                DXSpot(
+                    callsign=callsign,
+                    frequency=frequency,
+                    spotter="W1XYZ",
+                    time="1234Z",
+                )
+            )
+        assert len(small_client.spots_buffer) == 3
+        found = small_client.search_by_frequency(14000.0, 14350.0)
+        assert [spot.callsign for spot in found] == ["K1CCC", "K1DDD"]
+        assert small_client.get_band_spots("40m")[0].callsign == "K1BBB"
+        print("  Frequency search working")
+
         print("✓ DX client structure correct")
         return True
     except Exception as e:
@@ -222,6 +282,68 @@ def test_dx_client_structure():
         return False
 
 
+def test_receive_loop():
+    """Test that the receive loop buffers spots from a mixed chunk."""
+    print("\nTesting receive loop...")
+    try:
+        from dx_cluster_mcp_server.dx_client import DXClusterClient
+        from dx_cluster_mcp_server.config import DXClusterConfig
+
+        client = DXClusterClient(
+            DXClusterConfig(host="test.example.com", port=7300, callsign="TEST")
+        )
+        from dx_cluster_mcp_server.constants import STREAM_READER_LIMIT
+
+        chunk = (
+            b"Hello TEST, this is GB7DJK in Sussex\r\n"
+            b"DX de W1AW:     14025.0  JA1ABC       CW 599                 1235Z\r\n"
+            b"WWV de W0MU <18>:   SFI=70, A=5, K=1\r\n"
+            b"   DX de W2AW:   7010.0  JA2XYZ       CW                     1236Z\r\n"
+            b"\x07DX de W3AW:  21074.0  JA3XYZ       FT8 -10 dB             1237Z\r\n"
+            b"N0CALL de GB7DJK 1238Z >DX de W5AW:  3525.0  JA5XYZ  CW  1238Z\r\n"
+            b"DX de DL1ABC:  14195.0  JA6XYZ  73 J\xc3\xbcrgen  1239Z\r\n"
+            b"DX de W4AW:  28074.0  JA4XYZ       FT8 partial line"
+        )
+
+        async def feed(client, data):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            client.reader = reader
+            client.connected = True
+            await client._receive_loop()
+
+        asyncio.run(feed(client, chunk))
+
+        callsigns = [spot.callsign for spot in client.spots_buffer]
+        assert callsigns == ["JA1ABC", "JA2XYZ", "JA3XYZ", "JA5XYZ", "JA6XYZ"], callsigns
+        assert client.spots_buffer[-1].comment == "73 J\u00fcrgen"
+        assert client.connected is False
+        print(f"  Buffered spots: {', '.join(callsigns)}")
+
+        # An unterminated line past the limit ends the loop, like readline()
+        overflow_client = DXClusterClient(
+            DXClusterConfig(host="test.example.com", port=7300, callsign="TEST")
+        )
+        overflow = (
+            b"DX de W1AW:  14025.0  JA1ABC  CW  1235Z\r\n"
+            + b"x" * (2 * STREAM_READER_LIMIT)
+            + b"\nDX de W2AW:  7010.0  JA2XYZ  CW  1236Z\r\n"
+        )
+        asyncio.run(feed(overflow_client, overflow))
+        assert [spot.callsign for spot in overflow_client.spots_buffer] == ["JA1ABC"]
+        assert len(overflow_client._rxbuf) == 0
+        print("  Oversized line rejected")
+
+        print("✓ Receive loop working correctly")
+        return True
+    except Exception as e:
+        print(f"✗ Receive loop test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_mcp_handlers_structure():
     """Test MCP handlers structure (without actual client)."""
     print("\nTesting MCP handlers structure...")
@@ -259,8 +381,8 @@ def test_mcp_handlers_structure():
             "get_band_spots",
             "get_cluster_status",
         ]
-        for tool_name in expected_tools:
-            assert tool_name in tool_names
+        missing = set(expected_tools) - set(tool_names)
+        assert not missing, f"Missing tools: {missing}"
         print("  All expected tools present")
 
         print("✓ MCP handlers structure correct")
@@ -272,6 +394,30 @@ def test_mcp_handlers_structure():
         return False
 
 
+def test_source_encoding():
+    """Test that source files are valid UTF-8 without mojibake."""
+    print("\nTesting source encoding...")
+    try:
+        from pathlib import Path
+
+        root = Path(__file__).resolve().parent
+        sources = sorted(root.glob("src/**/*.py")) + sorted(root.glob("*.py"))
+        assert sources
+
+        for path in sources:
+            text = path.read_bytes().decode("utf-8")
+            assert "\ufffd" not in text, f"Replacement character in {path.name}"
+            # UTF-8 punctuation such as "•" misread as Latin-1/CP1252
+            assert "\u00e2\u20ac" not in text, f"Mojibake in {path.name}"
+        print(f"  Checked {len(sources)} source files")
+
+        print("✓ Source encoding correct")
+        return True
+    except Exception as e:
+        print(f"✗ Source encoding test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -286,7 +432,9 @@ def main():
     results.append(("Config", test_config()))
     results.append(("Constants", test_constants()))
     results.append(("DX Client", test_dx_client_structure()))
+    results.append(("Receive Loop", test_receive_loop()))
     results.append(("MCP Handlers", test_mcp_handlers_structure()))
+    results.append(("Source Encoding", test_source_encoding()))
 
     print("\n" + "=" * 60)
     print("Test Results Summary")